@@ -1,24 +1,32 @@
-import sys
-from collections.abc import Callable, Iterable, Mapping
-from threading import Thread
-from typing import Any
+import os
+from concurrent.futures import ThreadPoolExecutor
 
+# Shared pool so each CustomThread reuses a worker instead of paying
+# OS thread creation (and an 8 MiB stack reservation) per call.
+_POOL = ThreadPoolExecutor(
+    max_workers=min(32, (os.cpu_count() or 4) * 4),
+    thread_name_prefix="muiogo",
+)
 
-class CustomThread(Thread):
-    def __init__(self, group=None, target=None, name=None, args=(), kwargs={}, Verbose=None):
-        Thread.__init__(self, group, target, name, args, kwargs)
-        self._return = None
-        self._exc_info = None  # captures exception if thread crashes
 
-    def run(self):
-        if self._target is not None:
-            try:
-                self._return = self._target(*self._args, **self._kwargs)
-            except Exception:
-                self._exc_info = sys.exc_info()
+class CustomThread:
+    """Thread-like wrapper over a shared ThreadPoolExecutor.
 
-    def join(self):
-        Thread.join(self)
-        if self._exc_info is not None:
-            raise self._exc_info[1].with_traceback(self._exc_info[2])
-        return self._return
\ No newline at end of file
+    Keeps the call pattern of the old Thread subclass:
+        t = CustomThread(target=f, args=(...)); t.start(); result = t.join()
+    join() returns the target's return value and re-raises (with traceback)
+    any exception the target raised.
+    """
+
+    def __init__(self, group=None, target=None, name=None, args=(), kwargs=None, Verbose=None):
+        self._target = target
+        self._args = args
+        self._kwargs = kwargs if kwargs is not None else {}
+        self._future = None
+
+    def start(self):
+        self._future = _POOL.submit(self._target, *self._args, **self._kwargs)
+
+    def join(self, timeout=None):
+        # Future.result re-raises the target's exception with its traceback.
+        return self._future.result(timeout)